@@ -3,120 +3,306 @@
 Fetch ALL commander data from EDHREC and generate commanders.json
 
 Usage:
-    python scripts/fetch-edhrec-data.py [--output PATH] [--delay SECONDS]
+    python scripts/fetch-edhrec-data.py [--output PATH] [--rate REQUESTS_PER_SEC] [--workers N]
 
 This script:
 1. Fetches all commander slugs by following EDHREC's paginated commander list
-2. Fetches the average deck for each commander
-3. Saves the full deck lists to commanders.json
+2. Fetches the average deck for each commander (concurrently, rate limited)
+3. Streams each deck to an NDJSON file as it arrives, so an interrupted run
+   can be resumed with --resume
+4. Assembles the full deck lists into commanders.json
+
+Only the standard library is required; if orjson is installed it is used for
+faster JSON parsing and serialization.
 """
 
 import argparse
+import gzip
 import json
+import os
+import random
+import ssl
+import tempfile
+import threading
 import time
 import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from email.utils import parsedate_to_datetime
+from http.client import HTTPException, HTTPResponse, HTTPSConnection, RemoteDisconnected
+from itertools import combinations
 from pathlib import Path
-from urllib.request import urlopen, Request
-from urllib.error import HTTPError, URLError
-
-
-def fetch_json(url: str) -> dict | None:
-    """Fetch JSON from a URL with proper headers."""
-    headers = {
-        "User-Agent": "MTGDeckBuilder/1.0 (Educational Project)",
-        "Accept": "application/json",
-    }
-
-    try:
-        request = Request(url, headers=headers)
-        with urlopen(request, timeout=30) as response:
-            return json.loads(response.read().decode("utf-8"))
-    except HTTPError as e:
-        print(f"  HTTP Error {e.code}: {url}", file=sys.stderr)
-        return None
-    except URLError as e:
-        print(f"  URL Error: {url} - {e.reason}", file=sys.stderr)
+from queue import Empty, Full, Queue
+from typing import BinaryIO, Container, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+EDHREC_HOST = "json.edhrec.com"
+PAGES_PATH = "/pages/"
+HEADERS = {
+    "User-Agent": "MTGDeckBuilder/1.0 (Educational Project)",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+}
+
+# Color identity is always emitted in WUBRG order. There are only 32 possible
+# identities, so the ordered list for each is precomputed.
+COLOR_ORDER = ("W", "U", "B", "R", "G")
+COLOR_IDENTITIES = {
+    frozenset(colors): list(colors)
+    for size in range(len(COLOR_ORDER) + 1)
+    for colors in combinations(COLOR_ORDER, size)
+}
+
+# Single-digit deck entry counts, looked up rather than parsed with int()
+DIGIT_VALUES = {str(digit): digit for digit in range(10)}
+
+# Retry policy for transient failures: rate limiting, 5xx and dropped connections
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+BASE_DELAY = 1.0
+JITTER = 0.5
+MAX_RETRY_AFTER = 60.0
+
+# How often blocked queue operations re-check whether the run was stopped
+QUEUE_POLL_INTERVAL = 0.5
+
+# Fraction of the configured rate regained per successful request after a 429
+RATE_RECOVERY_STEP = 0.02
+
+
+# Field names match the keys in commanders.json, so instances serialize as-is
+@dataclass(slots=True)
+class CardEntry:
+    name: str
+    quantity: int
+
+
+@dataclass(slots=True)
+class Commander:
+    name: str
+    slug: str
+    colorIdentity: list[str]
+    numDecks: int
+    cards: list[CardEntry]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Commander":
+        """Rebuild a commander from its JSON representation."""
+        return cls(
+            name=data["name"],
+            slug=data["slug"],
+            colorIdentity=data["colorIdentity"],
+            numDecks=data["numDecks"],
+            cards=[CardEntry(card["name"], card["quantity"]) for card in data["cards"]],
+        )
+
+
+class RateLimiter:
+    """Thread-safe token bucket capping the global request rate.
+
+    When EDHREC answers 429 the rate is halved and every worker is held back
+    for the Retry-After period; each success then steps the rate back up
+    toward the configured maximum.
+    """
+
+    def __init__(self, rate: float, burst: int = 1, min_rate: float = 0.5):
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a request token is available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    wait = self.paused_until - now
+                else:
+                    self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                    self.updated = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+    def throttle(self, pause: float) -> None:
+        """Back off after a 429: pause all requests and halve the rate."""
+        with self.lock:
+            now = time.monotonic()
+            # Concurrent 429s from the same burst should only halve the rate once
+            if now >= self.paused_until:
+                self.rate = max(self.min_rate, self.rate / 2)
+            self.paused_until = max(self.paused_until, now + pause)
+            self.tokens = 0.0
+
+    def recover(self) -> None:
+        """Step the rate back toward its maximum after a successful request."""
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.max_rate * RATE_RECOVERY_STEP)
+
+
+class ResponseCache:
+    """On-disk cache of raw EDHREC responses, mirroring request paths under a directory.
+
+    Entries younger than ``ttl`` seconds are served without a request. Older
+    entries are revalidated with the ETag stored in a sidecar ``.etag`` file,
+    so unchanged pages come back as a bodiless 304.
+    """
+
+    def __init__(self, directory: Path, ttl: float):
+        self.directory = directory
+        self.ttl = ttl
+
+    def body_path(self, path: str) -> Path:
+        return self.directory / path.lstrip("/")
+
+    def etag_path(self, path: str) -> Path:
+        body_path = self.body_path(path)
+        return body_path.with_name(body_path.name + ".etag")
+
+    def load_fresh(self, path: str) -> bytes | None:
+        """Return the cached body if it is younger than the TTL."""
+        body_path = self.body_path(path)
+        try:
+            if time.time() - body_path.stat().st_mtime < self.ttl:
+                return body_path.read_bytes()
+        except OSError:
+            pass
         return None
-    except json.JSONDecodeError as e:
-        print(f"  JSON Error: {url} - {e}", file=sys.stderr)
-        return None
-
 
-def fetch_all_commander_slugs(delay: float = 0.3) -> list[str]:
-    """Fetch all commander slugs by following EDHREC's pagination."""
-    base_url = "https://json.edhrec.com/pages/"
-    slugs = []
-    seen_slugs = set()
-
-    # Start with the main commanders page
-    next_page = "commanders/year.json"
-    page_num = 0
+    def load(self, path: str) -> bytes | None:
+        """Return the cached body regardless of age."""
+        try:
+            return self.body_path(path).read_bytes()
+        except OSError:
+            return None
 
-    while next_page:
-        page_num += 1
-        url = base_url + next_page
-        print(f"[Page {page_num}] Fetching {next_page}...", file=sys.stderr)
+    def etag(self, path: str) -> str | None:
+        """Return the ETag the cached body was served with, if any."""
+        if not self.body_path(path).exists():
+            return None
+        try:
+            return self.etag_path(path).read_text().strip() or None
+        except OSError:
+            return None
 
-        data = fetch_json(url)
-        if not data:
-            break
-
-        page_slugs = 0
-        next_page = None
-
-        # Handle two different response structures:
-        # 1. First page: container.json_dict.cardlists[].cardviews[]
-        # 2. Pagination pages: cardviews[] at top level
-        if "cardviews" in data:
-            # Pagination page structure
-            for card in data.get("cardviews", []):
-                slug = card.get("sanitized")
-                if slug and slug not in seen_slugs:
-                    slugs.append(slug)
-                    seen_slugs.add(slug)
-                    page_slugs += 1
-            next_page = data.get("more")
+    def store(self, path: str, body: bytes, etag: str | None) -> None:
+        """Atomically write a response body and its ETag."""
+        body_path = self.body_path(path)
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(body_path, body)
+        if etag:
+            write_atomic(self.etag_path(path), etag.encode("utf-8"))
         else:
-            # First page structure
-            container = data.get("container", {})
-            json_dict = container.get("json_dict", {})
-            cardlists = json_dict.get("cardlists", [])
-
-            for cardlist in cardlists:
-                for card in cardlist.get("cardviews", []):
-                    slug = card.get("sanitized")
-                    if slug and slug not in seen_slugs:
-                        slugs.append(slug)
-                        seen_slugs.add(slug)
-                        page_slugs += 1
-                if cardlist.get("more"):
-                    next_page = cardlist.get("more")
-
-        print(f"  Found {page_slugs} new commanders (total: {len(slugs)})", file=sys.stderr)
+            self.etag_path(path).unlink(missing_ok=True)
+
+    def touch(self, path: str) -> None:
+        """Mark a cached body as freshly revalidated."""
+        self.body_path(path).touch()
+
+    def invalidate(self, path: str) -> None:
+        """Remove a cached body and its ETag."""
+        self.body_path(path).unlink(missing_ok=True)
+        self.etag_path(path).unlink(missing_ok=True)
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write data to a temporary file and move it into place."""
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as f:
+        f.write(data)
+    os.replace(f.name, path)
+
+
+def loads(data: bytes):
+    """Parse JSON bytes, using orjson when it is installed.
+
+    Raises ValueError on malformed input: JSONDecodeError from either parser,
+    or UnicodeDecodeError from the stdlib one on invalid UTF-8.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_indented(obj) -> bytes:
+    """Serialize to UTF-8 JSON indented by two spaces, matching json.dump(indent=2)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=asdict).encode("utf-8")
+
+
+def decode_body(body: bytes, content_encoding: str | None) -> bytes:
+    """Undo gzip or deflate Content-Encoding; http.client leaves bodies compressed."""
+    if not body:
+        # Bodiless responses (304, 429) may still carry a Content-Encoding header
+        return body
+    encoding = (content_encoding or "").strip().lower()
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            # Some servers send a raw deflate stream without the zlib header
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+def dumps_line(obj) -> bytes:
+    """Serialize to a single line of UTF-8 JSON terminated by a newline."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b"\n"
+    return json.dumps(obj, ensure_ascii=False, default=asdict).encode("utf-8") + b"\n"
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a Retry-After header given as seconds or an HTTP date."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        seconds = retry_at.timestamp() - time.time()
+    return min(max(seconds, 0.0), MAX_RETRY_AFTER)
 
-        if next_page:
-            time.sleep(delay)
 
-    return slugs
+def backoff_delay(attempt: int) -> float:
+    """Exponential backoff with jitter for the given zero-based retry attempt."""
+    return BASE_DELAY * (2 ** attempt) * (1 + random.random() * JITTER)
 
 
 def parse_deck_entry(entry: str) -> tuple[str, int]:
     """Parse a deck entry like '1 Card Name' or '29 Mountain' into (name, quantity)."""
-    parts = entry.split(" ", 1)
-    if len(parts) == 2 and parts[0].isdigit():
-        return (parts[1], int(parts[0]))
+    # Fast path for the usual single-digit count, avoiding partition and int()
+    if entry[1:2] == " ":
+        quantity = DIGIT_VALUES.get(entry[0])
+        if quantity is not None:
+            return (entry[2:], quantity)
+
+    count, separator, card_name = entry.partition(" ")
+    if separator and count.isdigit():
+        return (card_name, int(count))
     return (entry, 1)
 
 
-def fetch_commander_deck(slug: str) -> dict | None:
-    """Fetch average deck data for a commander from EDHREC."""
-    url = f"https://json.edhrec.com/pages/average-decks/{slug}.json"
-    data = fetch_json(url)
-
-    if not data:
-        return None
-
+def extract_commander_info(data: dict, slug: str) -> Commander | None:
+    """Build a commander entry from a parsed average-decks response."""
     try:
         container = data.get("container", {})
         json_dict = container.get("json_dict", {})
@@ -127,98 +313,438 @@ def fetch_commander_deck(slug: str) -> dict | None:
             return None
 
         # Extract color identity (convert to WUBRG order)
-        raw_colors = card.get("color_identity", [])
-        color_order = ["W", "U", "B", "R", "G"]
-        color_identity = [c for c in color_order if c in raw_colors]
+        raw_colors = frozenset(card.get("color_identity", ()))
+        color_identity = COLOR_IDENTITIES.get(raw_colors)
+        if color_identity is None:
+            # Unexpected symbols: keep just the WUBRG ones, in order
+            color_identity = [c for c in COLOR_ORDER if c in raw_colors]
 
         # Get deck count
         num_decks = card.get("num_decks", 0)
 
         # Extract full deck list from the "deck" array at top level
         deck_entries = data.get("deck", [])
-        card_list = []
-
-        for entry in deck_entries:
-            card_name, quantity = parse_deck_entry(entry)
-            card_list.append({"name": card_name, "quantity": quantity})
-
-        return {
-            "name": name,
-            "slug": slug,
-            "colorIdentity": color_identity,
-            "numDecks": num_decks,
-            "cards": card_list,
-        }
+        card_list = [
+            CardEntry(card_name, quantity)
+            for card_name, quantity in map(parse_deck_entry, deck_entries)
+        ]
+
+        return Commander(
+            name=name,
+            slug=slug,
+            colorIdentity=color_identity,
+            numDecks=num_decks,
+            cards=card_list,
+        )
 
     except Exception as e:
         print(f"  Extract error for {slug}: {e}", file=sys.stderr)
         return None
 
 
-def fetch_all_decks(slugs: list[str], delay: float = 0.3) -> list[dict]:
-    """Fetch deck data for all commanders."""
-    commanders = []
-    total = len(slugs)
-    failed = 0
+class EDHRECClient:
+    """Everything needed to talk to EDHREC: rate limit, connections, retries and caches.
+
+    All worker threads share one client, so they share a single rate limit
+    and response cache while each keeps its own keep-alive connection.
+    """
+
+    def __init__(self, limiter: RateLimiter, deck_cache: ResponseCache | None = None,
+                 page_cache: ResponseCache | None = None):
+        self.limiter = limiter
+        self.deck_cache = deck_cache
+        self.page_cache = page_cache
+        # One keep-alive connection per worker thread, so each request reuses
+        # an already-open TCP+TLS session instead of handshaking again. The
+        # TLS context (and its loaded CA bundle) is shared by all of them.
+        self._local = threading.local()
+        self._ssl_context = ssl.create_default_context()
+
+    def connection(self) -> HTTPSConnection:
+        """Return this thread's persistent connection to EDHREC."""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = HTTPSConnection(EDHREC_HOST, timeout=30, context=self._ssl_context)
+            self._local.connection = connection
+        return connection
+
+    def request(self, path: str, headers: dict[str, str]) -> tuple[HTTPResponse, bytes]:
+        """GET a path on the shared connection and return the decompressed body.
+
+        Reconnects once if the keep-alive socket went stale.
+        """
+        connection = self.connection()
+        for attempt in range(2):
+            try:
+                connection.request("GET", path, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+                break
+            except (RemoteDisconnected, BrokenPipeError, ConnectionResetError):
+                # The server closed an idle keep-alive socket; reopen and retry
+                connection.close()
+                if attempt:
+                    raise
+            except (OSError, HTTPException):
+                connection.close()
+                raise
+        return response, decode_body(body, response.getheader("Content-Encoding"))
+
+    def fetch_json(self, path: str, cache: ResponseCache | None = None) -> dict | None:
+        """Fetch JSON from an EDHREC path, retrying transient failures with backoff."""
+        url = f"https://{EDHREC_HOST}{path}"
+        headers = HEADERS
+
+        if cache is not None:
+            cached = cache.load_fresh(path)
+            if cached is not None:
+                try:
+                    return loads(cached)
+                except ValueError:
+                    # Corrupt entry: drop it so the refetch below is unconditional
+                    cache.invalidate(path)
+            etag = cache.etag(path)
+            if etag:
+                headers = {**HEADERS, "If-None-Match": etag}
+
+        for attempt in range(MAX_RETRIES + 1):
+            response = retry_after = None
+            self.limiter.acquire()
+            try:
+                response, body = self.request(path, headers)
+            except (OSError, HTTPException, EOFError, zlib.error) as e:
+                error = f"URL Error: {url} - {e}"
+            else:
+                if response.status == 304 and cache is not None and headers is not HEADERS:
+                    cached = cache.load(path)
+                    if cached is not None:
+                        try:
+                            data = loads(cached)
+                        except ValueError as e:
+                            print(f"  JSON Error: {url} (cached) - {e}", file=sys.stderr)
+                        else:
+                            self.limiter.recover()
+                            cache.touch(path)
+                            return data
+
+                    # The cached copy is missing or corrupt, so the 304 is no
+                    # use: drop the entry and ask again without If-None-Match
+                    cache.invalidate(path)
+                    headers = HEADERS
+                    error = f"Cache Error: {url} - cached copy unusable after 304"
+                    continue
+
+                if response.status == 200:
+                    try:
+                        data = loads(body)
+                    except ValueError as e:
+                        print(f"  JSON Error: {url} - {e}", file=sys.stderr)
+                        return None
+                    self.limiter.recover()
+                    if cache is not None:
+                        cache.store(path, body, response.getheader("ETag"))
+                    return data
+
+                error = f"HTTP Error {response.status}: {url}"
+                if response.status not in RETRYABLE_STATUSES:
+                    break
+                retry_after = parse_retry_after(response.getheader("Retry-After"))
+
+            delay = retry_after if retry_after is not None else backoff_delay(attempt)
+            throttled = response is not None and response.status == 429
+            if throttled:
+                # Slow every worker down, not just this one
+                self.limiter.throttle(delay)
+            if attempt == MAX_RETRIES:
+                break
+            print(f"  {error} (retrying in {delay:.1f}s)", file=sys.stderr)
+            if not throttled:
+                time.sleep(delay)
+
+        print(f"  {error}", file=sys.stderr)
+        return None
 
-    for i, slug in enumerate(slugs, 1):
-        print(f"[{i}/{total}] Fetching {slug}...", file=sys.stderr)
+    def iter_commander_slugs(self) -> Iterator[str]:
+        """Yield all commander slugs as EDHREC's pagination is followed."""
+        seen_slugs = set()
+
+        # Start with the main commanders page
+        next_page = "commanders/year.json"
+        page_num = 0
+
+        while next_page:
+            page_num += 1
+            print(f"[Page {page_num}] Fetching {next_page}...", file=sys.stderr)
+
+            data = self.fetch_json(PAGES_PATH + next_page, self.page_cache)
+            if not data:
+                break
+
+            next_page = None
+
+            # Handle two different response structures:
+            # 1. First page: container.json_dict.cardlists[].cardviews[]
+            # 2. Pagination pages: cardviews[] at top level
+            if "cardviews" in data:
+                # Pagination page structure
+                cardviews = data.get("cardviews", [])
+                next_page = data.get("more")
+            else:
+                # First page structure
+                container = data.get("container", {})
+                json_dict = container.get("json_dict", {})
+                cardlists = json_dict.get("cardlists", [])
+
+                cardviews = [card for cardlist in cardlists for card in cardlist.get("cardviews", [])]
+                for cardlist in cardlists:
+                    if cardlist.get("more"):
+                        next_page = cardlist.get("more")
+
+            # Dedupe the whole page in one pass; dict keys keep EDHREC's ranking order
+            page = dict.fromkeys(card.get("sanitized") for card in cardviews)
+            new_slugs = [slug for slug in page if slug and slug not in seen_slugs]
+            seen_slugs.update(new_slugs)
+
+            print(f"  Found {len(new_slugs)} new commanders (total: {len(seen_slugs)})", file=sys.stderr)
+            yield from new_slugs
+
+    def fetch_commander_deck(self, slug: str) -> Commander | None:
+        """Fetch average deck data for a commander from EDHREC.
+
+        Runs on a worker thread, so parsing and extraction happen alongside other
+        workers' network waits rather than on the thread collecting results.
+        """
+        data = self.fetch_json(f"{PAGES_PATH}average-decks/{slug}.json", self.deck_cache)
+        if not data:
+            return None
+        return extract_commander_info(data, slug)
 
-        commander = fetch_commander_deck(slug)
-        if commander:
-            total_cards = sum(c['quantity'] for c in commander['cards'])
-            commanders.append(commander)
-            print(f"  ✓ {commander['name']} ({total_cards} cards)", file=sys.stderr)
-        else:
-            failed += 1
-            print(f"  ✗ Failed", file=sys.stderr)
 
-        if i < total:
-            time.sleep(delay)
+def iter_and_cache_slugs(client: EDHRECClient, slugs_path: Path) -> Iterator[str]:
+    """Yield slugs as they are discovered, then cache the full list for future runs."""
+    slugs = []
+    for slug in client.iter_commander_slugs():
+        slugs.append(slug)
+        yield slug
+
+    slugs_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(slugs_path, "w") as f:
+        json.dump(slugs, f)
+    print(f"Cached {len(slugs)} slugs to {slugs_path}", file=sys.stderr)
+
+
+def fetch_all_decks(slugs: Iterable[str], client: EDHRECClient, out: BinaryIO,
+                    workers: int = 16, skip: Container[str] = frozenset()) -> int:
+    """Fetch deck data for commanders as their slugs arrive, appending each to an NDJSON file.
+
+    A producer thread feeds slugs into a bounded queue while worker threads
+    fetch decks, so deck fetching overlaps with slug pagination. Results are
+    written by this thread alone as they complete; slugs in ``skip`` are not
+    fetched. Returns the number of commanders written.
+    """
+    slug_queue = Queue(maxsize=1024)
+    result_queue = Queue()
+    stop = threading.Event()
+    fetched = 0
+    failed = 0
 
-    print(f"\nFetched {len(commanders)} commanders ({failed} failed)", file=sys.stderr)
-    return commanders
+    def enqueue(item: str | None) -> bool:
+        """Put an item on the slug queue, giving up once the run is stopped."""
+        while not stop.is_set():
+            try:
+                slug_queue.put(item, timeout=QUEUE_POLL_INTERVAL)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for slug in slugs:
+                if slug not in skip and not enqueue(slug):
+                    break
+        finally:
+            for _ in range(workers):
+                enqueue(None)
+
+    def consume() -> None:
+        try:
+            while not stop.is_set():
+                try:
+                    slug = slug_queue.get(timeout=QUEUE_POLL_INTERVAL)
+                except Empty:
+                    continue
+                if slug is None:
+                    break
+                try:
+                    commander = client.fetch_commander_deck(slug)
+                except Exception as e:
+                    # Count the slug as failed rather than losing this worker
+                    print(f"  Error fetching {slug}: {e!r}", file=sys.stderr)
+                    commander = None
+                result_queue.put((slug, commander))
+        finally:
+            result_queue.put(None)
+
+    with ThreadPoolExecutor(max_workers=workers + 1) as executor:
+        futures = [executor.submit(produce)]
+        futures += [executor.submit(consume) for _ in range(workers)]
+
+        try:
+            finished = 0
+            while finished < workers:
+                item = result_queue.get()
+                if item is None:
+                    finished += 1
+                    continue
+
+                slug, commander = item
+                print(f"[{fetched + failed + 1}] Fetched {slug}", file=sys.stderr)
+                if commander:
+                    total_cards = sum(c.quantity for c in commander.cards)
+                    out.write(dumps_line(commander))
+                    fetched += 1
+                    print(f"  ✓ {commander.name} ({total_cards} cards)", file=sys.stderr)
+                else:
+                    failed += 1
+                    print(f"  ✗ Failed", file=sys.stderr)
+        except BaseException:
+            # On Ctrl-C (or a write error) stop the producer and workers instead
+            # of letting the executor wait for them to scrape every remaining slug
+            stop.set()
+            while True:
+                try:
+                    slug_queue.get_nowait()
+                except Empty:
+                    break
+            raise
+
+        # Every worker has exited; release the producer too in case they died early
+        stop.set()
+        for future in futures:
+            future.result()
+
+    print(f"\nFetched {fetched} commanders ({failed} failed)", file=sys.stderr)
+    return fetched
+
+
+def iter_ndjson(path: Path) -> Iterator[dict]:
+    """Yield records from an NDJSON file, skipping a line cut off by an interrupted run."""
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                yield loads(line)
+            except ValueError:
+                continue
+
+
+def load_commanders(ndjson_path: Path) -> tuple[list[Commander], int, int]:
+    """Load commanders from the NDJSON file, keeping the latest entry per slug.
+
+    Returns the commanders along with the total unique card entries and total
+    card slots across them, tallied in the same pass.
+    """
+    by_slug = {}
+    total_unique_cards = 0
+    total_card_slots = 0
+    for record in iter_ndjson(ndjson_path):
+        commander = Commander.from_dict(record)
+
+        # A resumed run can append a slug again; swap out the older entry's counts
+        previous = by_slug.get(commander.slug)
+        if previous is not None:
+            total_unique_cards -= len(previous.cards)
+            total_card_slots -= sum(card.quantity for card in previous.cards)
+
+        by_slug[commander.slug] = commander
+        total_unique_cards += len(commander.cards)
+        total_card_slots += sum(card.quantity for card in commander.cards)
+
+    return list(by_slug.values()), total_unique_cards, total_card_slots
+
+
+def positive_float(value: str) -> float:
+    """argparse type for a strictly positive float."""
+    number = float(value)
+    if not number > 0:  # Also rejects NaN
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+
+def positive_int(value: str) -> int:
+    """argparse type for a strictly positive integer."""
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
 
 
 def main():
     parser = argparse.ArgumentParser(description="Fetch ALL EDHREC commander data")
     parser.add_argument("--output", type=str, default="src/assets/data/commanders.json",
                         help="Output file path")
-    parser.add_argument("--delay", type=float, default=0.3,
-                        help="Delay between requests in seconds")
+    parser.add_argument("--rate", type=positive_float, default=10.0,
+                        help="Maximum requests per second across all workers")
+    parser.add_argument("--workers", type=positive_int, default=16,
+                        help="Number of concurrent deck fetches")
     parser.add_argument("--skip-fetch-slugs", action="store_true",
                         help="Skip fetching slugs, use cached slugs file")
     parser.add_argument("--slugs-file", type=str, default="scripts/commander-slugs.json",
                         help="File to cache commander slugs")
+    parser.add_argument("--cache-dir", type=str, default="scripts/.cache/edhrec",
+                        help="Directory for cached EDHREC responses")
+    parser.add_argument("--cache-ttl", type=float, default=20.0,
+                        help="Hours before a cached deck is revalidated with EDHREC")
+    parser.add_argument("--page-cache-ttl", type=float, default=1.0,
+                        help="Hours before a cached commander list page is revalidated")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always fetch from EDHREC without reading or writing the cache")
+    parser.add_argument("--ndjson", type=str, default="scripts/.cache/commanders.ndjson",
+                        help="File commanders are streamed to as they are fetched")
+    parser.add_argument("--resume", action="store_true",
+                        help="Keep commanders already in the NDJSON file and skip refetching them")
     args = parser.parse_args()
 
     slugs_path = Path(args.slugs_file)
-
-    # Step 1: Get all commander slugs
+    deck_cache = page_cache = None
+    if not args.no_cache:
+        cache_dir = Path(args.cache_dir)
+        deck_cache = ResponseCache(cache_dir, ttl=args.cache_ttl * 3600)
+        page_cache = ResponseCache(cache_dir, ttl=args.page_cache_ttl * 3600)
+    client = EDHRECClient(RateLimiter(args.rate), deck_cache, page_cache)
+
+    # Step 1: Get all commander slugs (streamed into step 2 when fetched live)
     if args.skip_fetch_slugs and slugs_path.exists():
         print(f"Loading cached slugs from {slugs_path}...", file=sys.stderr)
-        with open(slugs_path) as f:
-            slugs = json.load(f)
+        # Drop duplicates (keeping order) so no slug costs a second round trip
+        slugs = list(dict.fromkeys(loads(slugs_path.read_bytes())))
         print(f"Loaded {len(slugs)} commander slugs", file=sys.stderr)
+        print(f"\nTotal commanders to fetch: {len(slugs)}", file=sys.stderr)
     else:
         print("Fetching all commander slugs from EDHREC...", file=sys.stderr)
-        slugs = fetch_all_commander_slugs(delay=args.delay)
+        slugs = iter_and_cache_slugs(client, slugs_path)
 
-        # Cache slugs for future runs
-        slugs_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(slugs_path, "w") as f:
-            json.dump(slugs, f)
-        print(f"Cached {len(slugs)} slugs to {slugs_path}", file=sys.stderr)
-
-    print(f"\nTotal commanders to fetch: {len(slugs)}", file=sys.stderr)
     print(f"Output: {args.output}", file=sys.stderr)
     print("", file=sys.stderr)
 
-    # Step 2: Fetch deck data for each commander
-    commanders = fetch_all_decks(slugs, delay=args.delay)
-
-    # Sort by popularity
-    commanders.sort(key=lambda c: c["numDecks"], reverse=True)
+    # Step 2: Fetch deck data for each commander as slugs become available,
+    # streaming each one to NDJSON instead of holding them all until the end
+    ndjson_path = Path(args.ndjson)
+    ndjson_path.parent.mkdir(parents=True, exist_ok=True)
+    done_slugs = set()
+    if args.resume and ndjson_path.exists():
+        done_slugs = {commander["slug"] for commander in iter_ndjson(ndjson_path)}
+        print(f"Resuming: {len(done_slugs)} commanders already fetched", file=sys.stderr)
+
+    with open(ndjson_path, "ab" if args.resume else "wb") as f:
+        if f.tell():
+            f.write(b"\n")  # Terminate any line cut off by an interrupted run
+        fetch_all_decks(slugs, client, f, workers=args.workers, skip=done_slugs)
+
+    # Step 3: Assemble the final file, sorted by popularity (slug breaks ties,
+    # since NDJSON lines arrive in completion order)
+    commanders, total_unique_cards, total_card_slots = load_commanders(ndjson_path)
+    commanders.sort(key=lambda c: (-c.numDecks, c.slug))
 
     # Create output structure
     output = {
@@ -230,8 +756,8 @@ def main():
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
+    with open(output_path, "wb") as f:
+        f.write(dumps_indented(output))
 
     print("", file=sys.stderr)
     print(f"✓ Saved {len(commanders)} commanders to {args.output}", file=sys.stderr)
@@ -239,14 +765,12 @@ def main():
     # Summary
     print(f"\nSummary:", file=sys.stderr)
     print(f"  Total commanders: {len(commanders)}", file=sys.stderr)
-    total_unique_cards = sum(len(c['cards']) for c in commanders)
-    total_card_slots = sum(sum(card['quantity'] for card in c['cards']) for c in commanders)
     avg_deck_size = total_card_slots / len(commanders) if commanders else 0
     print(f"  Total unique card entries: {total_unique_cards}", file=sys.stderr)
     print(f"  Total card slots: {total_card_slots}", file=sys.stderr)
     print(f"  Average deck size: {avg_deck_size:.1f} cards", file=sys.stderr)
     if commanders:
-        print(f"  Most popular: {commanders[0]['name']} ({commanders[0]['numDecks']:,} decks)", file=sys.stderr)
+        print(f"  Most popular: {commanders[0].name} ({commanders[0].numDecks:,} decks)", file=sys.stderr)
 
 
 if __name__ == "__main__":